@@ -1,24 +1,58 @@
 """The Hildebrand Glow integration."""
 from __future__ import annotations
+import asyncio
 import logging
+from datetime import timedelta
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
 from .api import GlowmarktApiClient
-from .const import DOMAIN, CONF_ELECTRICITY_RATE, CONF_GAS_RATE, CONF_ELECTRICITY_STANDING_CHARGE, CONF_GAS_STANDING_CHARGE, DEFAULT_ELECTRICITY_RATE, DEFAULT_GAS_RATE, DEFAULT_ELECTRICITY_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE
+from .const import DOMAIN, DATA_TOKEN_CACHE, FIRST_REFRESH_TIMEOUT, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, CONF_ELECTRICITY_RATE, CONF_GAS_RATE, CONF_ELECTRICITY_STANDING_CHARGE, CONF_GAS_STANDING_CHARGE, DEFAULT_ELECTRICITY_RATE, DEFAULT_GAS_RATE, DEFAULT_ELECTRICITY_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE
 from .coordinator import GlowmarktDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+def _get_scan_interval(entry: ConfigEntry) -> timedelta:
+    seconds = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL.total_seconds())
+    return max(timedelta(seconds=seconds), MIN_SCAN_INTERVAL)
+
+def _async_create_session(hass: HomeAssistant, entry: ConfigEntry) -> aiohttp.ClientSession:
+    """Create the entry's session, closed on unload or when HA stops."""
+    # Dedicated connector with longer keep-alive and DNS caching than the shared HA session,
+    # keeping HA's SSL context and User-Agent
+    connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75, ttl_dns_cache=300, ssl=get_default_context())
+    session = aiohttp.ClientSession(connector=connector, headers={USER_AGENT: SERVER_SOFTWARE})
+
+    async def _async_close_session(event: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(session.close)
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session))
+    return session
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
-    session = async_get_clientsession(hass)
-    client = GlowmarktApiClient(username=entry.data[CONF_USERNAME], password=entry.data[CONF_PASSWORD], session=session)
+    session = _async_create_session(hass, entry)
+    # Reuse a still-valid token from before a reload rather than authenticating again
+    token, token_expiry = hass.data[DOMAIN].get(DATA_TOKEN_CACHE, {}).pop(entry.entry_id, (None, None))
+    client = GlowmarktApiClient(username=entry.data[CONF_USERNAME], password=entry.data[CONF_PASSWORD], session=session, token=token, token_expiry=token_expiry)
     tariff_config = {"electricity_rate": entry.data.get(CONF_ELECTRICITY_RATE, DEFAULT_ELECTRICITY_RATE), "gas_rate": entry.data.get(CONF_GAS_RATE, DEFAULT_GAS_RATE), "electricity_standing_charge": entry.data.get(CONF_ELECTRICITY_STANDING_CHARGE, DEFAULT_ELECTRICITY_STANDING_CHARGE), "gas_standing_charge": entry.data.get(CONF_GAS_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE)}
-    coordinator = GlowmarktDataUpdateCoordinator(hass=hass, api_client=client, tariff_config=tariff_config)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = GlowmarktDataUpdateCoordinator(hass=hass, api_client=client, tariff_config=tariff_config, update_interval=_get_scan_interval(entry))
+    entry.async_on_unload(coordinator.async_shutdown)
+    # Give the first refresh a bounded head start, then let it finish in the background
+    first_refresh = entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN} first refresh")
+    await asyncio.wait((first_refresh,), timeout=FIRST_REFRESH_TIMEOUT)
+    if not first_refresh.done():
+        _LOGGER.debug("First refresh still running after %ss, continuing setup", FIRST_REFRESH_TIMEOUT)
+    elif not coordinator.last_update_success:
+        # Failed outright rather than slowly, so let HA retry setup as before
+        raise ConfigEntryNotReady(f"Initial update failed: {coordinator.last_exception}") from coordinator.last_exception
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -28,9 +62,16 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     coordinator: GlowmarktDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     tariff_config = {"electricity_rate": entry.data.get(CONF_ELECTRICITY_RATE, DEFAULT_ELECTRICITY_RATE), "gas_rate": entry.data.get(CONF_GAS_RATE, DEFAULT_GAS_RATE), "electricity_standing_charge": entry.data.get(CONF_ELECTRICITY_STANDING_CHARGE, DEFAULT_ELECTRICITY_STANDING_CHARGE), "gas_standing_charge": entry.data.get(CONF_GAS_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE)}
     coordinator.update_tariff_config(tariff_config)
+    coordinator.update_interval = _get_scan_interval(entry)
     await coordinator.async_request_refresh()
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: GlowmarktDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if auth_state := coordinator.api_client.auth_state:
+            hass.data[DOMAIN].setdefault(DATA_TOKEN_CACHE, {})[entry.entry_id] = auth_state
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # The token is only kept for reloads; drop it once the entry is deleted
+    hass.data.get(DOMAIN, {}).get(DATA_TOKEN_CACHE, {}).pop(entry.entry_id, None)
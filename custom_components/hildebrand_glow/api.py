@@ -1,18 +1,48 @@
 """Glowmarkt API client for Hildebrand Glow integration."""
 from __future__ import annotations
+import asyncio
+import base64
 import logging
+import random
+import time
 from datetime import datetime, timedelta, timezone
+from math import fsum
+from operator import itemgetter
 from zoneinfo import ZoneInfo
 from typing import Any
 import aiohttp
+import orjson
 from aiohttp import ClientError, ClientResponseError
-from .const import GLOWMARKT_API_BASE, GLOWMARKT_APP_ID
+from yarl import URL
+from .const import API_MAX_ATTEMPTS, API_MAX_CONCURRENT_REQUESTS, API_RETRY_BASE_DELAY, API_RETRY_JITTER, API_RETRY_MAX_DELAY, GLOWMARKT_API_BASE, GLOWMARKT_APP_ID, TOKEN_EXPIRY_MARGIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed once so per-request URLs are built by joining path segments
+API_BASE_URL = URL(GLOWMARKT_API_BASE)
+
 # UK timezone for proper day boundaries
 UK_TZ = ZoneInfo("Europe/London")
 
+# Readings only change on half-hour boundaries, so cache them per resource per half-hour slot
+READING_BUCKET_SECONDS = 1800
+READING_CACHE_MAX_AGE = 7200
+
+# Readings arrive as [timestamp, value] pairs
+_reading_value = itemgetter(1)
+
+def _parse_token_expiry(data: dict[str, Any]) -> datetime:
+    """Return the token expiry from the auth response, falling back to the JWT exp claim."""
+    try:
+        exp = data.get("exp")
+        if exp is None:
+            payload = data["token"].split(".")[1]
+            exp = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["exp"]
+        return datetime.fromtimestamp(exp, tz=timezone.utc)
+    except (IndexError, KeyError, TypeError, ValueError, OverflowError, OSError):
+        _LOGGER.debug("Could not determine token expiry, assuming 6 days")
+        return datetime.now(timezone.utc) + timedelta(days=6)
+
 class GlowmarktAuthError(Exception):
     """Exception for authentication errors."""
 
@@ -22,142 +52,197 @@ class GlowmarktApiError(Exception):
 class GlowmarktApiClient:
     """Async client for the Glowmarkt API."""
 
-    def __init__(self, username: str, password: str, session: aiohttp.ClientSession) -> None:
+    def __init__(self, username: str, password: str, session: aiohttp.ClientSession, token: str | None = None, token_expiry: datetime | None = None) -> None:
         self._username = username
         self._password = password
         self._session = session
-        self._token: str | None = None
-        self._token_expiry: datetime | None = None
-        self._virtual_entity_id: str | None = None
+        self._token = token
+        self._token_expiry = token_expiry
+        self._headers: dict[str, str] = {"Content-Type": "application/json", "applicationId": GLOWMARKT_APP_ID, "token": token or ""}
         self._resources: dict[str, dict[str, Any]] = {}
+        self._resource_index: tuple[tuple[str, str], ...] = ()
+        self._auth_task: asyncio.Task[bool] | None = None
+        self._discovery_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
+        # Caps in-flight requests so gathered fetches don't outrun the connector's per-host limit
+        self._request_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._reading_cache: dict[tuple[str, int], tuple[float, float | None]] = {}
+
+    async def _request_with_retry(self, method: str, url: URL, **kwargs: Any) -> Any:
+        """Send a request and return its JSON body, retrying 5xx/429 and connection errors with backoff."""
+        attempt = 0
+        while True:
+            try:
+                async with self._request_semaphore, self._session.request(method, url, **kwargs) as response:
+                    if response.status == 401:
+                        self._token = None
+                        self._headers["token"] = ""
+                        raise GlowmarktAuthError("Token expired or rejected (401)")
+                    response.raise_for_status()
+                    return await response.json(loads=orjson.loads)
+            except ClientError as err:
+                attempt += 1
+                retryable = not isinstance(err, ClientResponseError) or err.status == 429 or err.status >= 500
+                if not retryable or attempt >= API_MAX_ATTEMPTS:
+                    raise
+                delay = min(API_RETRY_BASE_DELAY * 2 ** (attempt - 1) * (1 + random.random() * API_RETRY_JITTER), API_RETRY_MAX_DELAY)
+                _LOGGER.debug("%s %s failed (%s), retrying in %.1fs", method, url, err, delay)
+                await asyncio.sleep(delay)
 
     async def authenticate(self) -> bool:
         headers = {"Content-Type": "application/json", "applicationId": GLOWMARKT_APP_ID}
         payload = {"username": self._username, "password": self._password}
         try:
-            async with self._session.post(f"{GLOWMARKT_API_BASE}/auth", headers=headers, json=payload) as response:
-                if response.status == 401:
-                    raise GlowmarktAuthError("Invalid username or password")
-                response.raise_for_status()
-                data = await response.json()
-                if data.get("valid"):
-                    self._token = data["token"]
-                    self._token_expiry = datetime.now() + timedelta(days=6)
-                    _LOGGER.debug("Authentication successful, token expires in 6 days")
-                    return True
-                else:
-                    raise GlowmarktAuthError("Authentication failed: invalid response")
+            data = await self._request_with_retry("POST", API_BASE_URL / "auth", headers=headers, data=orjson.dumps(payload))
+        except GlowmarktAuthError as err:
+            raise GlowmarktAuthError("Invalid username or password") from err
         except ClientResponseError as err:
             raise GlowmarktAuthError(f"Authentication failed: {err}") from err
         except ClientError as err:
             raise GlowmarktApiError(f"Connection error: {err}") from err
+        if data.get("valid") and (token := data.get("token")):
+            self._token = token
+            self._headers["token"] = token
+            self._token_expiry = _parse_token_expiry(data)
+            _LOGGER.debug("Authentication successful, token expires %s", self._token_expiry)
+            return True
+        raise GlowmarktAuthError("Authentication failed: invalid response")
 
     async def _ensure_authenticated(self) -> None:
-        if self._token is None or self._token_expiry is None or datetime.now() > self._token_expiry:
-            await self.authenticate()
+        """Authenticate if the token is missing or close to expiry, sharing one auth request between concurrent callers."""
+        if self._token is not None and self._token_expiry is not None and datetime.now(timezone.utc) < self._token_expiry - TOKEN_EXPIRY_MARGIN:
+            return
+        if self._auth_task is None:
+            self._auth_task = asyncio.create_task(self.authenticate())
+            self._auth_task.add_done_callback(self._auth_done)
+        await asyncio.shield(self._auth_task)
 
-    def _get_headers(self) -> dict[str, str]:
-        return {"Content-Type": "application/json", "applicationId": GLOWMARKT_APP_ID, "token": self._token or ""}
+    def _auth_done(self, task: asyncio.Task[bool]) -> None:
+        self._auth_task = None
+        if not task.cancelled():
+            task.exception()  # Mark retrieved; awaiting callers still see it
 
     async def get_virtual_entities(self) -> list[dict[str, Any]]:
         await self._ensure_authenticated()
         try:
-            async with self._session.get(f"{GLOWMARKT_API_BASE}/virtualentity", headers=self._get_headers()) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data if isinstance(data, list) else []
+            data = await self._request_with_retry("GET", API_BASE_URL / "virtualentity", headers=self._headers)
+            return data if isinstance(data, list) else []
         except ClientError as err:
             raise GlowmarktApiError(f"Failed to get virtual entities: {err}") from err
 
+    async def _fetch_ve_resources(self, ve_id: str) -> list[dict[str, Any]]:
+        data = await self._request_with_retry("GET", API_BASE_URL / "virtualentity" / ve_id / "resources", headers=self._headers)
+        return data.get("resources", [])
+
     async def discover_resources(self) -> dict[str, dict[str, Any]]:
+        """Discover resources, sharing a single in-flight discovery between concurrent callers."""
+        if self._discovery_task is None:
+            self._discovery_task = asyncio.create_task(self._discover_resources())
+            self._discovery_task.add_done_callback(self._discovery_done)
+        return await asyncio.shield(self._discovery_task)
+
+    def _discovery_done(self, task: asyncio.Task[dict[str, dict[str, Any]]]) -> None:
+        self._discovery_task = None
+        if not task.cancelled():
+            task.exception()  # Mark retrieved; awaiting callers still see it
+
+    async def _discover_resources(self) -> dict[str, dict[str, Any]]:
         await self._ensure_authenticated()
         virtual_entities = await self.get_virtual_entities()
         if not virtual_entities:
             return {}
+        ve_ids = [ve["veId"] for ve in virtual_entities if ve.get("veId")]
+        if not ve_ids:
+            return {}
+        # Authenticate once up front so a failed login surfaces instead of reading as missing data
+        await self._ensure_authenticated()
+        results = await asyncio.gather(*(self._fetch_ve_resources(ve_id) for ve_id in ve_ids), return_exceptions=True)
         self._resources = {}
-        for ve in virtual_entities:
-            ve_id = ve.get("veId")
-            if not ve_id:
+        for ve_id, resources in zip(ve_ids, results):
+            if isinstance(resources, ClientError):
+                _LOGGER.error("Failed to get resources for %s: %s", ve_id, resources)
                 continue
-            self._virtual_entity_id = ve_id
-            try:
-                async with self._session.get(f"{GLOWMARKT_API_BASE}/virtualentity/{ve_id}/resources", headers=self._get_headers()) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    resources = data.get("resources", [])
-                    for resource in resources:
-                        resource_id = resource.get("resourceId")
-                        classifier = resource.get("classifier")
-                        if resource_id and classifier:
-                            self._resources[classifier] = {"resource_id": resource_id, "name": resource.get("name", classifier), "classifier": classifier, "base_unit": resource.get("baseUnit", "")}
-                            _LOGGER.debug("Found resource: %s (%s)", classifier, resource_id)
-            except ClientError as err:
-                _LOGGER.error("Failed to get resources for %s: %s", ve_id, err)
+            if isinstance(resources, BaseException):
+                raise resources
+            for resource in resources:
+                resource_id = resource.get("resourceId")
+                classifier = resource.get("classifier")
+                if resource_id and classifier:
+                    self._resources[classifier] = {"resource_id": resource_id, "name": resource.get("name", classifier), "classifier": classifier, "base_unit": resource.get("baseUnit", "")}
+                    _LOGGER.debug("Found resource: %s (%s)", classifier, resource_id)
+        self._resource_index = tuple((c, r["resource_id"]) for c, r in self._resources.items())
         return self._resources
 
     async def get_daily_reading(self, resource_id: str) -> float | None:
         """Get daily reading by fetching 30-min intervals and summing them."""
+        # API expects UTC, so anchor there
+        now_utc = datetime.now(timezone.utc)
+        
+        now_mono = time.monotonic()
+        bucket = int(now_utc.timestamp()) // READING_BUCKET_SECONDS
+        cache_key = (resource_id, bucket)
+        if cache_key in self._reading_cache:
+            _LOGGER.debug("Using cached reading for %s", resource_id)
+            return self._reading_cache[cache_key][1]
+        
         await self._ensure_authenticated()
         
         # Use UK timezone for proper day boundaries
-        now_uk = datetime.now(UK_TZ)
-        today_start_uk = now_uk.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Convert to UTC for API call (API expects UTC)
+        today_start_uk = now_utc.astimezone(UK_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
         today_start_utc = today_start_uk.astimezone(timezone.utc)
-        now_utc = now_uk.astimezone(timezone.utc)
-        
+        from_ts = today_start_utc.replace(tzinfo=None).isoformat(timespec="seconds")
+        to_ts = now_utc.replace(tzinfo=None).isoformat(timespec="seconds")
         _LOGGER.debug(
-            "Fetching readings for %s from %s to %s (UK: %s to %s)",
-            resource_id,
-            today_start_utc.strftime("%Y-%m-%dT%H:%M:%S"),
-            now_utc.strftime("%Y-%m-%dT%H:%M:%S"),
-            today_start_uk.strftime("%Y-%m-%d %H:%M"),
-            now_uk.strftime("%H:%M")
+            "Fetching readings for %s from %s to %s (UK day start: %s)",
+            resource_id, from_ts, to_ts, today_start_uk
         )
         
         try:
             # Fetch 30-minute interval data for today and sum it
             params = {
-                "from": today_start_utc.strftime("%Y-%m-%dT%H:%M:%S"),
-                "to": now_utc.strftime("%Y-%m-%dT%H:%M:%S"),
+                "from": from_ts,
+                "to": to_ts,
                 "period": "PT30M",
                 "offset": 0,
                 "function": "sum"
             }
             _LOGGER.debug("API params: %s", params)
             
-            async with self._session.get(
-                f"{GLOWMARKT_API_BASE}/resource/{resource_id}/readings",
-                headers=self._get_headers(),
+            data = await self._request_with_retry(
+                "GET",
+                API_BASE_URL / "resource" / resource_id / "readings",
+                headers=self._headers,
                 params=params
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+            )
+            
+            status = data.get("status")
+            readings = data.get("data") or []
+            count = len(readings)
+            _LOGGER.debug("API response status: %s, data points: %s", status, count)
+            
+            if status == "OK" and readings:
+                # Log the last 5 readings, only building timestamps when debug is on
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    for reading in readings[-5:]:
+                        _LOGGER.debug("  %s: %s kWh", datetime.fromtimestamp(reading[0], tz=UK_TZ).strftime("%H:%M"), reading[1])
                 
-                _LOGGER.debug("API response status: %s, data points: %s", 
-                    data.get("status"), 
-                    len(data.get("data", [])) if data.get("data") else 0
-                )
+                # Sum all the 30-minute readings
+                total = round(fsum(v for v in map(_reading_value, readings) if v is not None), 3)
+                _LOGGER.info("Resource %s: summed %d readings = %.3f kWh", resource_id, count, total)
+                # Only cache once the slot before the current one is published and the current slot has
+                # no value yet, otherwise an incomplete total would be pinned for the rest of the half hour
+                slot_start = bucket * READING_BUCKET_SECONDS
+                last_slot_start = slot_start - READING_BUCKET_SECONDS
+                if (any(last_slot_start <= r[0] < slot_start and r[1] is not None for r in readings)
+                        and not any(r[0] >= slot_start and r[1] is not None for r in readings)):
+                    # Evict expired entries only when inserting, so cache hits stay cheap
+                    self._reading_cache = {k: v for k, v in self._reading_cache.items() if now_mono - v[0] < READING_CACHE_MAX_AGE}
+                    self._reading_cache[cache_key] = (now_mono, total)
+                return total
+            else:
+                _LOGGER.warning("No data returned for %s. Status: %s, Response: %s", 
+                    resource_id, status, data)
+                return None  # Return None instead of 0 when no data
                 
-                if data.get("status") == "OK" and data.get("data"):
-                    readings = data["data"]
-                    # Log each reading for debugging
-                    for reading in readings[-5:]:  # Log last 5 readings
-                        ts = datetime.fromtimestamp(reading[0], tz=UK_TZ).strftime("%H:%M")
-                        val = reading[1]
-                        _LOGGER.debug("  %s: %s kWh", ts, val)
-                    
-                    # Sum all the 30-minute readings
-                    total = sum(reading[1] for reading in readings if reading[1] is not None)
-                    _LOGGER.info("Resource %s: summed %d readings = %.3f kWh", 
-                        resource_id, len(readings), total)
-                    return round(total, 3)
-                else:
-                    _LOGGER.warning("No data returned for %s. Status: %s, Response: %s", 
-                        resource_id, data.get("status"), data)
-                    return None  # Return None instead of 0 when no data
-                    
         except ClientResponseError as err:
             _LOGGER.error("API error for %s: %s %s", resource_id, err.status, err.message)
             return None
@@ -166,13 +251,29 @@ class GlowmarktApiClient:
             return None
 
     async def get_all_readings(self) -> dict[str, float | None]:
-        if not self._resources:
+        if not self._resource_index:
             await self.discover_resources()
-        readings = {}
-        for classifier, resource in self._resources.items():
-            readings[classifier] = await self.get_daily_reading(resource["resource_id"])
+        index = self._resource_index
+        if not index:
+            return {}
+        results = await asyncio.gather(*(self.get_daily_reading(resource_id) for _, resource_id in index), return_exceptions=True)
+        readings: dict[str, float | None] = {}
+        for (classifier, _), result in zip(index, results):
+            if isinstance(result, (GlowmarktAuthError, GlowmarktApiError)):
+                raise result
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to get reading for %s: %s", classifier, result)
+                result = None
+            readings[classifier] = result
         return readings
 
+    @property
+    def auth_state(self) -> tuple[str, datetime] | None:
+        """Return the current token and its expiry so it can be reused by a new client."""
+        if self._token is None or self._token_expiry is None:
+            return None
+        return self._token, self._token_expiry
+
     @property
     def resources(self) -> dict[str, dict[str, Any]]:
         return self._resources
@@ -180,7 +281,6 @@ class GlowmarktApiClient:
     async def test_connection(self) -> bool:
         try:
             await self.authenticate()
-            await self.discover_resources()
-            return len(self._resources) > 0
+            return bool(await self.get_virtual_entities())
         except (GlowmarktAuthError, GlowmarktApiError):
             return False
@@ -9,7 +9,7 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api import GlowmarktApiClient, GlowmarktAuthError, GlowmarktApiError
-from .const import DOMAIN, CONF_ELECTRICITY_RATE, CONF_GAS_RATE, CONF_ELECTRICITY_STANDING_CHARGE, CONF_GAS_STANDING_CHARGE, DEFAULT_ELECTRICITY_RATE, DEFAULT_GAS_RATE, DEFAULT_ELECTRICITY_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE
+from .const import DOMAIN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, CONF_ELECTRICITY_RATE, CONF_GAS_RATE, CONF_ELECTRICITY_STANDING_CHARGE, CONF_GAS_STANDING_CHARGE, DEFAULT_ELECTRICITY_RATE, DEFAULT_GAS_RATE, DEFAULT_ELECTRICITY_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,8 +55,10 @@ class HildebrandGlowOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         if user_input is not None:
-            new_data = {**self.config_entry.data, **user_input}
+            # The scan interval lives in options only; keep it out of entry.data
+            new_data = {**self.config_entry.data, **{k: v for k, v in user_input.items() if k != CONF_SCAN_INTERVAL}}
             self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
             return self.async_create_entry(title="", data=user_input)
         current_data = self.config_entry.data
-        return self.async_show_form(step_id="init", data_schema=vol.Schema({vol.Required(CONF_ELECTRICITY_RATE, default=current_data.get(CONF_ELECTRICITY_RATE, DEFAULT_ELECTRICITY_RATE)): vol.Coerce(float), vol.Required(CONF_ELECTRICITY_STANDING_CHARGE, default=current_data.get(CONF_ELECTRICITY_STANDING_CHARGE, DEFAULT_ELECTRICITY_STANDING_CHARGE)): vol.Coerce(float), vol.Required(CONF_GAS_RATE, default=current_data.get(CONF_GAS_RATE, DEFAULT_GAS_RATE)): vol.Coerce(float), vol.Required(CONF_GAS_STANDING_CHARGE, default=current_data.get(CONF_GAS_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE)): vol.Coerce(float)}))
+        scan_interval = int(self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL.total_seconds()))
+        return self.async_show_form(step_id="init", data_schema=vol.Schema({vol.Required(CONF_ELECTRICITY_RATE, default=current_data.get(CONF_ELECTRICITY_RATE, DEFAULT_ELECTRICITY_RATE)): vol.Coerce(float), vol.Required(CONF_ELECTRICITY_STANDING_CHARGE, default=current_data.get(CONF_ELECTRICITY_STANDING_CHARGE, DEFAULT_ELECTRICITY_STANDING_CHARGE)): vol.Coerce(float), vol.Required(CONF_GAS_RATE, default=current_data.get(CONF_GAS_RATE, DEFAULT_GAS_RATE)): vol.Coerce(float), vol.Required(CONF_GAS_STANDING_CHARGE, default=current_data.get(CONF_GAS_STANDING_CHARGE, DEFAULT_GAS_STANDING_CHARGE)): vol.Coerce(float), vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(vol.Coerce(int), vol.Range(min=int(MIN_SCAN_INTERVAL.total_seconds())))}))
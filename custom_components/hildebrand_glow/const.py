@@ -6,8 +6,17 @@ from typing import Final
 DOMAIN: Final = "hildebrand_glow"
 GLOWMARKT_API_BASE: Final = "https://api.glowmarkt.com/api/v0-1"
 GLOWMARKT_APP_ID: Final = "b0f1b774-a586-4f72-9edd-27ead8aa7a8d"
-CONF_APP_ID: Final = "app_id"
+DATA_TOKEN_CACHE: Final = "token_cache"
 DEFAULT_SCAN_INTERVAL: Final = timedelta(minutes=5)
+MIN_SCAN_INTERVAL: Final = timedelta(seconds=60)
+FIRST_REFRESH_TIMEOUT: Final = 10
+STALE_DATA_THRESHOLD: Final = timedelta(hours=6)
+TOKEN_EXPIRY_MARGIN: Final = timedelta(minutes=5)
+API_MAX_ATTEMPTS: Final = 3
+API_MAX_CONCURRENT_REQUESTS: Final = 4
+API_RETRY_BASE_DELAY: Final = 1.0
+API_RETRY_JITTER: Final = 0.5
+API_RETRY_MAX_DELAY: Final = 30.0
 DEFAULT_ELECTRICITY_RATE: Final = 0.245
 DEFAULT_GAS_RATE: Final = 0.065
 DEFAULT_ELECTRICITY_STANDING_CHARGE: Final = 0.45
@@ -16,9 +25,9 @@ CONF_ELECTRICITY_RATE: Final = "electricity_rate"
 CONF_GAS_RATE: Final = "gas_rate"
 CONF_ELECTRICITY_STANDING_CHARGE: Final = "electricity_standing_charge"
 CONF_GAS_STANDING_CHARGE: Final = "gas_standing_charge"
+CONF_SCAN_INTERVAL: Final = "scan_interval"
 CLASSIFIER_ELECTRICITY_CONSUMPTION: Final = "electricity.consumption"
 CLASSIFIER_ELECTRICITY_COST: Final = "electricity.consumption.cost"
 CLASSIFIER_GAS_CONSUMPTION: Final = "gas.consumption"
 CLASSIFIER_GAS_COST: Final = "gas.consumption.cost"
-PLATFORMS: Final = ["sensor"]
 ATTRIBUTION: Final = "Data provided by Hildebrand Technology via Glowmarkt API"
@@ -1,78 +1,138 @@
 """Data update coordinator for Hildebrand Glow integration."""
 from __future__ import annotations
 import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Any
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .api import GlowmarktApiClient, GlowmarktApiError, GlowmarktAuthError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .api import UK_TZ, GlowmarktApiClient, GlowmarktApiError, GlowmarktAuthError
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, STALE_DATA_THRESHOLD, CLASSIFIER_ELECTRICITY_COST, CLASSIFIER_GAS_COST
 
 _LOGGER = logging.getLogger(__name__)
 
+# The API reports these in pence; sensors expose them in GBP
+PENCE_CLASSIFIERS = (CLASSIFIER_ELECTRICITY_COST, CLASSIFIER_GAS_COST)
+
 class GlowmarktDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Glowmarkt data."""
 
-    def __init__(self, hass: HomeAssistant, api_client: GlowmarktApiClient, tariff_config: dict[str, float]) -> None:
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=DEFAULT_SCAN_INTERVAL)
+    def __init__(self, hass: HomeAssistant, api_client: GlowmarktApiClient, tariff_config: dict[str, float], update_interval: timedelta = DEFAULT_SCAN_INTERVAL) -> None:
+        # Readings and costs are rounded, so unchanged polls compare equal and skip state writes
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval, always_update=False)
         self.api_client = api_client
-        self.tariff_config = tariff_config
         self._resources: dict[str, dict[str, Any]] = {}
-        self._last_readings: dict[str, float] = {}  # Cache last known good readings
+        self._resources_view = MappingProxyType(self._resources)
+        self._last_readings: dict[str, float | None] = {}  # Cache last known good readings
+        self._last_cost_inputs: tuple[float | None, float | None] | None = None
+        self._last_cost_block: dict[str, float] = {}
+        self._last_good: float | None = None  # Monotonic time of the last poll with any fresh reading
+        self._tariff_changed = True  # Set by _apply_tariff, cleared once a poll has rebuilt the costs
+        self._apply_tariff(tariff_config)
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+        self._schedule_midnight()
 
     async def _async_update_data(self) -> dict[str, Any]:
         try:
+            # The client discovers resources on first use, then fetches all readings concurrently
+            readings = await self.api_client.get_all_readings()
             if not self._resources:
-                self._resources = await self.api_client.discover_resources()
+                self._resources.update(self.api_client.resources)
             
-            readings = await self.api_client.get_all_readings()
+            # Nothing new since the last good poll and no tariff change: keep the previous data
+            # object so listeners aren't triggered
+            if any(v is not None for v in readings.values()):
+                self._last_good = time.monotonic()
+            elif self.data is not None and self._last_good is not None and not self._tariff_changed:
+                if time.monotonic() - self._last_good > STALE_DATA_THRESHOLD.total_seconds():
+                    raise UpdateFailed(f"No new readings for over {STALE_DATA_THRESHOLD}")
+                _LOGGER.debug("No fresh readings returned, keeping previous data")
+                return self.data
             
             # Merge with cached readings - only update if we got valid data
-            for key, value in readings.items():
-                if value is not None:
-                    self._last_readings[key] = value
+            fresh = {k: float(v) for k, v in readings.items() if v is not None}
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for key, value in fresh.items():
                     _LOGGER.debug("Updated %s to %.3f", key, value)
-                elif key in self._last_readings:
-                    _LOGGER.debug("Keeping cached value for %s: %.3f (API returned None)", 
-                        key, self._last_readings[key])
-            
-            # Use cached readings for the data
-            merged_readings = {k: self._last_readings.get(k) for k in readings.keys()}
-            
-            data: dict[str, Any] = {"readings": merged_readings, "resources": self._resources, "costs": {}}
-            
-            elec = merged_readings.get("electricity.consumption")
-            if elec is not None:
-                elec_rate = self.tariff_config.get("electricity_rate", 0)
-                elec_standing = self.tariff_config.get("electricity_standing_charge", 0)
-                data["costs"]["electricity"] = round((elec * elec_rate) + elec_standing, 2)
+                for key in readings.keys() - fresh.keys():
+                    if self._last_readings.get(key) is not None:
+                        _LOGGER.debug("Keeping cached value for %s: %.3f (API returned None)", 
+                            key, self._last_readings[key])
+            self._last_readings.update(fresh)
+            for key in readings:
+                self._last_readings.setdefault(key, None)
             
-            gas = merged_readings.get("gas.consumption")
-            if gas is not None:
-                gas_rate = self.tariff_config.get("gas_rate", 0)
-                gas_standing = self.tariff_config.get("gas_standing_charge", 0)
-                data["costs"]["gas"] = round((gas * gas_rate) + gas_standing, 2)
+            # The cache now holds the merged value for every key, so snapshot it for the data
+            merged_readings = dict(self._last_readings)
+            for key in PENCE_CLASSIFIERS:
+                if merged_readings.get(key) is not None:
+                    merged_readings[key] = round(merged_readings[key] / 100.0, 2)
             
-            data["costs"]["total"] = round(data["costs"].get("electricity", 0) + data["costs"].get("gas", 0), 2)
-            data["costs"]["standing_charges_total"] = round(
-                self.tariff_config.get("electricity_standing_charge", 0) + 
-                self.tariff_config.get("gas_standing_charge", 0), 2
-            )
+            # Costs only depend on consumption and tariff, so reuse them while those are unchanged
+            elec = self._last_readings.get("electricity.consumption")
+            gas = self._last_readings.get("gas.consumption")
+            cost_inputs = (elec, gas)
+            if cost_inputs != self._last_cost_inputs:
+                self._last_cost_block = self._calculate_costs(elec, gas)
+                self._last_cost_inputs = cost_inputs
+            self._tariff_changed = False
             
-            return data
+            return {"readings": merged_readings, "resources": self._resources_view, "costs": self._last_cost_block}
             
         except GlowmarktAuthError as err:
             raise UpdateFailed(f"Authentication error: {err}") from err
         except GlowmarktApiError as err:
             raise UpdateFailed(f"API error: {err}") from err
 
+    def _apply_tariff(self, tariff_config: dict[str, float]) -> None:
+        """Resolve tariff values once so each poll only does the arithmetic."""
+        self.tariff_config = tariff_config
+        self._elec_rate = float(tariff_config.get("electricity_rate", 0))
+        self._elec_standing = float(tariff_config.get("electricity_standing_charge", 0))
+        self._gas_rate = float(tariff_config.get("gas_rate", 0))
+        self._gas_standing = float(tariff_config.get("gas_standing_charge", 0))
+        self._standing_charges_total = round(self._elec_standing + self._gas_standing, 2)
+        self._last_cost_inputs = None
+        self._tariff_changed = True
+
+    def _calculate_costs(self, elec: float | None, gas: float | None) -> dict[str, float]:
+        costs: dict[str, float] = {}
+        if elec is not None:
+            costs["electricity"] = round((elec * self._elec_rate) + self._elec_standing, 2)
+        if gas is not None:
+            costs["gas"] = round((gas * self._gas_rate) + self._gas_standing, 2)
+        costs["total"] = round(costs.get("electricity", 0.0) + costs.get("gas", 0.0), 2)
+        costs["standing_charges_total"] = self._standing_charges_total
+        return costs
+
     @property
-    def resources(self) -> dict[str, dict[str, Any]]:
-        return self._resources
+    def resources(self) -> Mapping[str, dict[str, Any]]:
+        return self._resources_view
 
     def update_tariff_config(self, tariff_config: dict[str, float]) -> None:
-        self.tariff_config = tariff_config
+        self._apply_tariff(tariff_config)
     
+    def _schedule_midnight(self) -> None:
+        # The API client's day boundary is UK midnight, whatever timezone HA is configured with
+        next_midnight = (datetime.now(UK_TZ) + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._unsub_midnight = async_track_point_in_utc_time(self.hass, self._handle_midnight, next_midnight.astimezone(timezone.utc))
+
+    @callback
+    def _handle_midnight(self, now: datetime) -> None:
+        self.clear_daily_cache()
+        self._schedule_midnight()
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        await super().async_shutdown()
+
     def clear_daily_cache(self) -> None:
-        """Clear the cached readings (call at midnight)."""
+        """Clear the cached readings (runs at midnight)."""
         self._last_readings.clear()
+        self._last_good = None
         _LOGGER.debug("Cleared daily reading cache")